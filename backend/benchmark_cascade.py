@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark voor de model cascade (nl_core_news_sm -> nl_core_news_lg).
+Vergelijkt snelheid en detecties van de cascade met een run op alleen het grote model.
+
+Gebruik:
+    SPACY_CASCADE=true python benchmark_cascade.py [pad/naar/bestand.csv]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SPACY_CASCADE", "true")
+
+import pandas as pd
+
+import main
+
+DEFAULT_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_dutch_data.csv")
+
+def load_cells(path: str):
+    """Lees alle niet-lege cellen uit een CSV of Excel bestand."""
+    if path.endswith('.csv'):
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_excel(path)
+
+    df = df.fillna("")
+    cells = []
+    for col in df.columns:
+        for value in df[col]:
+            text = str(value)
+            if text.strip():
+                cells.append(text)
+    return cells
+
+def span_set(results):
+    return {(r.entity_type, r.start, r.end) for r in results}
+
+def main_benchmark():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DATA
+
+    if main.fast_analyzer is None:
+        print("❌ Cascade is niet actief (zet SPACY_CASCADE=true en installeer nl_core_news_sm)")
+        sys.exit(1)
+
+    cells = load_cells(path)
+    print("="*80)
+    print("CASCADE BENCHMARK")
+    print("="*80)
+    print(f"Bestand: {path}")
+    print(f"Cellen:  {len(cells)}")
+    print(f"Modellen: {main.CASCADE_SMALL_MODEL} -> {main.loaded_model}")
+    print()
+
+    # Warm-up zodat lazy initialisatie niet meetelt
+    main.analyzer.analyze(text="Jan Jansen woont in Amsterdam.", language="nl")
+    main.cascade_analyze("Jan Jansen woont in Amsterdam.")
+
+    # Referentie: alleen het grote model
+    started = time.perf_counter()
+    reference = [span_set(main.analyzer.analyze(text=text, language="nl")) for text in cells]
+    large_only_seconds = time.perf_counter() - started
+
+    # Cascade
+    main.reset_cascade_stats()
+    started = time.perf_counter()
+    cascade = [span_set(main.cascade_analyze(text)) for text in cells]
+    cascade_seconds = time.perf_counter() - started
+
+    # Detecties van de cascade vergelijken met het grote model
+    true_positives = sum(len(ref & got) for ref, got in zip(reference, cascade))
+    reference_total = sum(len(ref) for ref in reference)
+    cascade_total = sum(len(got) for got in cascade)
+    precision = true_positives / cascade_total if cascade_total else 1.0
+    recall = true_positives / reference_total if reference_total else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+    report = main.get_cascade_report()
+    print(f"Large-only:      {large_only_seconds:.3f}s")
+    print(f"Cascade:         {cascade_seconds:.3f}s")
+    print(f"Speed-up:        {large_only_seconds / cascade_seconds:.2f}x")
+    print(f"Escalatiegraad:  {report['escalation_rate']:.1%} ({report['escalated']}/{report['cells']})")
+    print()
+    print("Overeenkomst met large-only (exacte spans):")
+    print(f"  Precision: {precision:.3f}")
+    print(f"  Recall:    {recall:.3f}")
+    print(f"  F1:        {f1:.3f}")
+    print()
+
+if __name__ == "__main__":
+    main_benchmark()
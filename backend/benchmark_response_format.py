@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark voor het deep-analyze response formaat.
+Vergelijkt payload grootte en encode tijd van het huidige (full) formaat met het compacte formaat.
+
+Gebruik:
+    python benchmark_response_format.py [pad/naar/bestand.csv] [--repeat N]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+
+import orjson
+
+import main
+
+DEFAULT_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_dutch_data.csv")
+
+def time_encode(encode, payload, runs: int = 20):
+    """Geef (bytes, gemiddelde encode tijd in ms) terug."""
+    body = encode(payload)
+    started = time.perf_counter()
+    for _ in range(runs):
+        encode(payload)
+    return body, (time.perf_counter() - started) / runs * 1000
+
+def main_benchmark():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", nargs="?", default=DEFAULT_DATA)
+    parser.add_argument("--repeat", type=int, default=1, help="Herhaal de geanalyseerde rijen N keer")
+    args = parser.parse_args()
+
+    with open(args.path, "rb") as f:
+        contents = f.read()
+
+    _, entry = main.cache_file(contents, os.path.basename(args.path))
+    columns = list(entry["df"].columns)
+
+    analyzed_rows = [row for _, row, _ in main.iter_analyzed_rows(entry, None, 0, len(entry["df"]))]
+    analyzed_rows = analyzed_rows * args.repeat
+
+    full_payload = {"columns": columns, "rows": analyzed_rows}
+    compact_payload = {"columns": columns, "format": "compact"}
+    compact_payload.update(main.build_compact_rows(columns, analyzed_rows))
+
+    orjson_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    full_body, full_ms = time_encode(lambda p: json.dumps(p).encode(), full_payload)
+    compact_body, compact_ms = time_encode(lambda p: orjson.dumps(p, option=orjson_options), compact_payload)
+
+    full_gzip = len(gzip.compress(full_body, compresslevel=5))
+    compact_gzip = len(gzip.compress(compact_body, compresslevel=5))
+
+    print("="*80)
+    print("DEEP-ANALYZE RESPONSE FORMAT BENCHMARK")
+    print("="*80)
+    print(f"Bestand: {args.path}")
+    print(f"Rijen:   {len(analyzed_rows)}  Kolommen: {len(columns)}")
+    print()
+    print(f"{'Formaat':25s} {'Bytes':>12s} {'Gzip bytes':>12s} {'Encode (ms)':>12s}")
+    print(f"{'full (json)':25s} {len(full_body):12d} {full_gzip:12d} {full_ms:12.3f}")
+    print(f"{'compact (orjson)':25s} {len(compact_body):12d} {compact_gzip:12d} {compact_ms:12.3f}")
+    print()
+    print(f"Grootte:      {len(full_body) / len(compact_body):.1f}x kleiner ({full_gzip / compact_gzip:.1f}x met gzip)")
+    print(f"Encode tijd:  {full_ms / compact_ms:.1f}x sneller")
+    print()
+
+if __name__ == "__main__":
+    main_benchmark()
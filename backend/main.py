@@ -1,12 +1,17 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse, Response
+from fastapi.concurrency import run_in_threadpool
+import orjson
 import pandas as pd
 import io
 import json
 import re
-from typing import List, Dict, Optional, Tuple
-from collections import defaultdict
+import hashlib
+import threading
+from typing import List, Dict, Optional, Tuple, Iterator
+from collections import defaultdict, OrderedDict
 
 # Presidio & Spacy imports
 from presidio_analyzer import AnalyzerEngine, RecognizerResult, PatternRecognizer, Pattern
@@ -25,6 +30,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# xlsx is zelf al een zip: de anonimiseer download niet nogmaals gzippen.
+# Starlette's lijst met uitgesloten content types is niet configureerbaar, dus
+# sluiten we de route uit die dit media type serveert.
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+GZIP_EXCLUDED_PATHS = {"/api/anonymize"}
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware die de routes in GZIP_EXCLUDED_PATHS ongemoeid laat."""
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in GZIP_EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Comprimeer responses (JSON, compact en NDJSON) voor clients die gzip accepteren
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # --- CUSTOM RECOGNIZERS ---
 
 def is_valid_bsn(number: str) -> bool:
@@ -132,21 +154,39 @@ email_recognizer = PatternRecognizer(
 # --- SETUP NLP ENGINE MET CUSTOM RECOGNIZERS ---
 # Try to load the large model, fallback to medium or small if memory issues
 import os
+import time
 
 # Allow configuration via environment variable
 SPACY_MODEL = os.getenv("SPACY_MODEL", "nl_core_news_lg")
 
+# Cascade mode: elke cel eerst door het kleine model, alleen twijfelgevallen naar het grote model
+SPACY_CASCADE = os.getenv("SPACY_CASCADE", "false").lower() in ("1", "true", "yes")
+CASCADE_SMALL_MODEL = os.getenv("CASCADE_SMALL_MODEL", "nl_core_news_sm")
+CASCADE_LONG_TEXT = int(os.getenv("CASCADE_LONG_TEXT", "300"))
+
+# Entities die van het NER model komen (de pattern recognizers zijn model-onafhankelijk)
+CASCADE_NER_ENTITIES = {"PERSON", "ORGANIZATION", "LOCATION"}
+# Labels in nlp_artifacts.entities: Presidio heeft de spaCy labels al hernoemd
+# (ORG -> ORGANIZATION, LOC/GPE -> LOCATION, NORP -> NRP)
+CASCADE_NER_LABELS = {"PERSON", "ORGANIZATION", "LOCATION", "NRP"}
+
+# Windowing: lange cellen (bv. complete email threads) in overlappende vensters analyseren
+WINDOW_THRESHOLD = int(os.getenv("ANALYZE_WINDOW_THRESHOLD", "5000"))
+WINDOW_SIZE = int(os.getenv("ANALYZE_WINDOW_SIZE", "2000"))
+WINDOW_OVERLAP = int(os.getenv("ANALYZE_WINDOW_OVERLAP", "200"))
+WINDOW_BATCH_SIZE = int(os.getenv("ANALYZE_WINDOW_BATCH_SIZE", "8"))
+
 # Try loading the model with fallback
-def create_nlp_engine():
+def create_nlp_engine(preferred_model: str = SPACY_MODEL):
     """Create NLP engine with fallback to smaller models if large model fails."""
     models_to_try = []
     
-    if SPACY_MODEL == "nl_core_news_lg":
+    if preferred_model == "nl_core_news_lg":
         models_to_try = ["nl_core_news_lg", "nl_core_news_md", "nl_core_news_sm"]
-    elif SPACY_MODEL == "nl_core_news_md":
+    elif preferred_model == "nl_core_news_md":
         models_to_try = ["nl_core_news_md", "nl_core_news_sm"]
     else:
-        models_to_try = [SPACY_MODEL]
+        models_to_try = [preferred_model]
     
     for model_name in models_to_try:
         try:
@@ -167,19 +207,57 @@ def create_nlp_engine():
     
     raise Exception("No suitable spaCy model could be loaded")
 
+def create_analyzer(engine) -> AnalyzerEngine:
+    """Maak een analyzer met alle custom recognizers op de gegeven NLP engine."""
+    engine_analyzer = AnalyzerEngine(nlp_engine=engine, supported_languages=["nl"])
+    
+    # Voeg custom recognizers toe
+    engine_analyzer.registry.add_recognizer(BsnRecognizer())
+    engine_analyzer.registry.add_recognizer(postcode_recognizer)
+    engine_analyzer.registry.add_recognizer(iban_recognizer)
+    engine_analyzer.registry.add_recognizer(phone_recognizer)
+    engine_analyzer.registry.add_recognizer(policy_recognizer)
+    engine_analyzer.registry.add_recognizer(email_recognizer)
+    
+    return engine_analyzer
+
 nlp_engine, loaded_model = create_nlp_engine()
 print(f"Using spaCy model: {loaded_model}")
 
 # Maak analyzer met alle custom recognizers
-analyzer = AnalyzerEngine(nlp_engine=nlp_engine, supported_languages=["nl"])
-
-# Voeg custom recognizers toe
-analyzer.registry.add_recognizer(BsnRecognizer())
-analyzer.registry.add_recognizer(postcode_recognizer)
-analyzer.registry.add_recognizer(iban_recognizer)
-analyzer.registry.add_recognizer(phone_recognizer)
-analyzer.registry.add_recognizer(policy_recognizer)
-analyzer.registry.add_recognizer(email_recognizer)
+analyzer = create_analyzer(nlp_engine)
+
+# Optioneel: klein model voor de eerste pass van de cascade
+fast_nlp_engine = None
+fast_analyzer = None
+if SPACY_CASCADE:
+    if loaded_model == CASCADE_SMALL_MODEL:
+        print(f"⚠️  Cascade uitgeschakeld: groot model is teruggevallen op {loaded_model}")
+    else:
+        try:
+            fast_nlp_engine, fast_model = create_nlp_engine(CASCADE_SMALL_MODEL)
+            fast_analyzer = create_analyzer(fast_nlp_engine)
+            print(f"Cascade actief: {fast_model} -> {loaded_model}")
+        except Exception as e:
+            fast_nlp_engine = None
+            print(f"⚠️  Cascade uitgeschakeld: {CASCADE_SMALL_MODEL} kon niet geladen worden ({e})")
+
+cascade_stats = {
+    "cells": 0,
+    "escalated": 0,
+    "chars": 0,
+    "escalated_chars": 0,
+    "fast_seconds": 0.0,
+    "large_seconds": 0.0,
+}
+# Analyse draait in threadpool workers, dus tellers alleen onder deze lock bijwerken
+cascade_stats_lock = threading.Lock()
+
+def add_cascade_stats(**deltas):
+    """Tel waarden op bij de cascade statistieken."""
+    with cascade_stats_lock:
+        for key, value in deltas.items():
+            cascade_stats[key] += value
 
 anonymizer = AnonymizerEngine()
 
@@ -255,6 +333,12 @@ def analyze_text(text: str, entities: Optional[List[str]] = None, language: str
         return []
     
     try:
+        if len(text) > WINDOW_THRESHOLD:
+            return analyze_windowed(text, entities, language)
+        
+        if fast_analyzer is not None:
+            return cascade_analyze(text, entities, language)
+        
         results = analyzer.analyze(
             text=text,
             entities=entities,
@@ -266,6 +350,187 @@ def analyze_text(text: str, entities: Optional[List[str]] = None, language: str
         print(f"Error analyzing text: {e}")
         return []
 
+def split_windows(text: str) -> List[Tuple[int, str]]:
+    """
+    Splits lange tekst in overlappende vensters van maximaal WINDOW_SIZE karakters.
+    Vensters eindigen bij voorkeur op een zinsgrens, anders op een spatie.
+    Retourneert (offset, venster tekst) tuples.
+    """
+    # Overlap maximaal een kwart venster; vensters eindigen na minstens een half venster, dus we gaan altijd vooruit
+    overlap = min(WINDOW_OVERLAP, WINDOW_SIZE // 4)
+    windows = []
+    start = 0
+    
+    while start < len(text):
+        end = min(start + WINDOW_SIZE, len(text))
+        
+        if end < len(text):
+            # Zoek een zinsgrens in de tweede helft van het venster
+            min_cut = start + WINDOW_SIZE // 2
+            cut = max(text.rfind(sep, min_cut, end) for sep in (". ", "! ", "? ", "\n"))
+            if cut == -1:
+                cut = text.rfind(" ", min_cut, end)
+            if cut != -1:
+                end = cut + 1
+        
+        windows.append((start, text[start:end]))
+        if end >= len(text):
+            break
+        
+        # Volgend venster begint `overlap` terug, op een woordgrens als er dan nog overlap overblijft
+        start = end - overlap
+        space = text.find(" ", start, end - 1)
+        if space != -1:
+            start = space + 1
+    
+    return windows
+
+def merge_window_results(results: List[RecognizerResult]) -> List[RecognizerResult]:
+    """Voeg overlappende spans van hetzelfde type samen (dubbelingen uit de overlap)."""
+    merged = []
+    for result in sorted(results, key=lambda r: (r.entity_type, r.start, -r.end)):
+        last = merged[-1] if merged else None
+        if last is not None and last.entity_type == result.entity_type and result.start < last.end:
+            last.end = max(last.end, result.end)
+            last.score = max(last.score, result.score)
+            continue
+        merged.append(result)
+    
+    return sorted(merged, key=lambda r: r.start)
+
+def analyze_windowed(text: str, entities: Optional[List[str]] = None, language: str = "nl") -> List[RecognizerResult]:
+    """
+    Analyseer lange tekst per venster, in batches door spaCy.
+    Offsets worden teruggerekend naar de originele tekst.
+    """
+    started = time.perf_counter()
+    windows = split_windows(text)
+    
+    results = []
+    batch = nlp_engine.process_batch(
+        [window_text for _, window_text in windows],
+        language,
+        batch_size=WINDOW_BATCH_SIZE
+    )
+    for (offset, window_text), (_, nlp_artifacts) in zip(windows, batch):
+        for result in analyzer.analyze(
+            text=window_text,
+            entities=entities,
+            language=language,
+            nlp_artifacts=nlp_artifacts,
+            return_decision_process=False
+        ):
+            result.start += offset
+            result.end += offset
+            results.append(result)
+    
+    # Lange tekst gaat in cascade mode altijd naar het grote model; tel mee in de statistieken
+    if fast_analyzer is not None:
+        add_cascade_stats(
+            cells=1,
+            escalated=1,
+            chars=len(text),
+            escalated_chars=len(text),
+            large_seconds=time.perf_counter() - started
+        )
+    
+    return merge_window_results(results)
+
+def needs_escalation(text: str, nlp_artifacts, entities: Optional[List[str]] = None) -> bool:
+    """
+    Bepaal of een cel na de snelle pass opnieuw door het grote model moet.
+    Signalen: lange tekst, en eigennamen (PROPN) die niet met de NER spans overeenkomen.
+    """
+    # Als er geen NER entities gevraagd zijn, is het kleine model voldoende
+    if entities is not None and not CASCADE_NER_ENTITIES.intersection(entities):
+        return False
+    
+    # Lange vrije tekst altijd naar het grote model
+    if len(text) >= CASCADE_LONG_TEXT:
+        return True
+    
+    # Presidio geeft alle spaCy NER spans dezelfde score, dus die zegt niets over twijfel.
+    # Twijfelgevallen: NER span zonder eigennaam, of eigennaam zonder NER span
+    covered = set()
+    for ent in nlp_artifacts.entities:
+        if ent.label_ not in CASCADE_NER_LABELS:
+            continue
+        covered.update(range(ent.start, ent.end))
+        if not any(token.pos_ == "PROPN" for token in ent):
+            return True
+    
+    for token in nlp_artifacts.tokens:
+        if token.pos_ == "PROPN" and token.i not in covered:
+            return True
+    
+    return False
+
+def cascade_analyze(text: str, entities: Optional[List[str]] = None, language: str = "nl") -> List[RecognizerResult]:
+    """Analyseer eerst met het kleine model, escaleer twijfelgevallen naar het grote model."""
+    started = time.perf_counter()
+    nlp_artifacts = fast_nlp_engine.process_text(text, language)
+    results = fast_analyzer.analyze(
+        text=text,
+        entities=entities,
+        language=language,
+        nlp_artifacts=nlp_artifacts,
+        return_decision_process=False
+    )
+    add_cascade_stats(fast_seconds=time.perf_counter() - started, cells=1, chars=len(text))
+    
+    if not needs_escalation(text, nlp_artifacts, entities):
+        return results
+    
+    started = time.perf_counter()
+    results = analyzer.analyze(
+        text=text,
+        entities=entities,
+        language=language,
+        return_decision_process=False
+    )
+    add_cascade_stats(
+        large_seconds=time.perf_counter() - started,
+        escalated=1,
+        escalated_chars=len(text)
+    )
+    return results
+
+def get_cascade_report() -> Dict:
+    """Escalatiegraad en geschatte speed-up van de cascade t.o.v. alleen het grote model."""
+    with cascade_stats_lock:
+        stats = dict(cascade_stats)
+    
+    cells = stats["cells"]
+    escalated = stats["escalated"]
+    total_seconds = stats["fast_seconds"] + stats["large_seconds"]
+    
+    # Schat de tijd van een large-only run op basis van de gemeten tijd per karakter
+    estimated_large_only = None
+    speedup = None
+    if stats["escalated_chars"] > 0 and total_seconds > 0:
+        seconds_per_char = stats["large_seconds"] / stats["escalated_chars"]
+        estimated_large_only = seconds_per_char * stats["chars"]
+        speedup = estimated_large_only / total_seconds
+    
+    return {
+        "enabled": fast_analyzer is not None,
+        "small_model": CASCADE_SMALL_MODEL if fast_analyzer is not None else None,
+        "large_model": loaded_model,
+        "cells": cells,
+        "escalated": escalated,
+        "escalation_rate": escalated / cells if cells else 0.0,
+        "fast_seconds": stats["fast_seconds"],
+        "large_seconds": stats["large_seconds"],
+        "estimated_large_only_seconds": estimated_large_only,
+        "estimated_speedup": speedup,
+    }
+
+def reset_cascade_stats():
+    """Zet de cascade tellers terug naar nul."""
+    with cascade_stats_lock:
+        for key in cascade_stats:
+            cascade_stats[key] = 0.0 if key.endswith("_seconds") else 0
+
 def anonymize_text(text: str, results: List[RecognizerResult]) -> str:
     """Anonimiseer text met specifieke labels per entity type."""
     if not results:
@@ -288,6 +553,250 @@ def anonymize_text(text: str, results: List[RecognizerResult]) -> str:
         print(f"Error anonymizing text: {e}")
         return text
 
+def read_dataframe(contents: bytes, filename: str) -> pd.DataFrame:
+    """Lees een geüpload CSV of Excel bestand in als DataFrame zonder NaN."""
+    buffer = io.BytesIO(contents)
+    if filename.endswith('.csv'):
+        df = pd.read_csv(buffer)
+    else:
+        df = pd.read_excel(buffer)
+    return df.fillna("")
+
+def analyze_cell(cell_value, entities: Optional[List[str]] = None) -> Dict:
+    """Analyseer één cel en geef origineel, entities en geanonimiseerde preview terug."""
+    text_value = str(cell_value) if pd.notna(cell_value) and cell_value != "" else ""
+    
+    # Analyseer deze cel
+    entities_found = []
+    if text_value:
+        results = analyze_text(text_value, entities, "nl")
+        
+        for result in results:
+            entities_found.append({
+                "type": result.entity_type,
+                "start": result.start,
+                "end": result.end,
+                "score": result.score,
+                "text": text_value[result.start:result.end]
+            })
+    
+    # Genereer preview (geanonimiseerde versie)
+    preview_text = text_value
+    if entities_found:
+        # Sorteer entities van achter naar voren om indices te behouden
+        sorted_entities = sorted(entities_found, key=lambda x: x['start'], reverse=True)
+        for entity in sorted_entities:
+            label = get_entity_label(entity['type'])
+            preview_text = preview_text[:entity['start']] + label + preview_text[entity['end']:]
+    
+    return {
+        "original": text_value,
+        "entities": entities_found,
+        "preview": preview_text,
+        "has_pii": len(entities_found) > 0
+    }
+
+# --- ANALYSE CACHE VOOR PAGINERING ---
+# Geüploade bestanden en reeds geanalyseerde rijen blijven bewaard zodat
+# volgende pagina's zonder opnieuw uploaden of analyseren opgehaald kunnen worden.
+
+ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", "8"))
+if ANALYSIS_CACHE_SIZE < 1:
+    raise ValueError(f"ANALYSIS_CACHE_SIZE moet minstens 1 zijn (was {ANALYSIS_CACHE_SIZE})")
+# Maximum aantal geanalyseerde rijen per bestand (over alle entity combinaties samen)
+ANALYSIS_CACHE_MAX_ROWS = int(os.getenv("ANALYSIS_CACHE_MAX_ROWS", "2000"))
+DEEP_ANALYZE_PAGE_SIZE = 10
+DEEP_ANALYZE_MAX_PAGE_SIZE = 500
+
+analysis_cache: "OrderedDict[str, Dict]" = OrderedDict()
+analysis_cache_lock = threading.Lock()
+
+def cache_file(contents: bytes, filename: str) -> Tuple[str, Dict]:
+    """
+    Zet een bestand in de cache en geef (file_id, entry) terug.
+    De entry blijft bruikbaar ook als hij door andere uploads al uit de cache is gevallen.
+    """
+    file_id = hashlib.sha256(contents).hexdigest()
+    with analysis_cache_lock:
+        entry = analysis_cache.get(file_id)
+        if entry is not None:
+            analysis_cache.move_to_end(file_id)
+            return file_id, entry
+    
+    entry = {
+        "df": read_dataframe(contents, filename),
+        "filename": filename,
+        "rows": OrderedDict(),
+    }
+    with analysis_cache_lock:
+        analysis_cache[file_id] = entry
+        analysis_cache.move_to_end(file_id)
+        while len(analysis_cache) > ANALYSIS_CACHE_SIZE:
+            analysis_cache.popitem(last=False)
+    return file_id, entry
+
+def get_cached_file(file_id: str) -> Optional[Dict]:
+    """Haal een bestand uit de cache (of None als het verlopen is)."""
+    with analysis_cache_lock:
+        entry = analysis_cache.get(file_id)
+        if entry is not None:
+            analysis_cache.move_to_end(file_id)
+        return entry
+
+def get_cached_row(entry: Dict, key: Tuple) -> Optional[Tuple[Dict, Dict]]:
+    """Haal een geanalyseerde rij uit de cache van dit bestand."""
+    with analysis_cache_lock:
+        cached = entry["rows"].get(key)
+        if cached is not None:
+            entry["rows"].move_to_end(key)
+        return cached
+
+def put_cached_row(entry: Dict, key: Tuple, analyzed: Tuple[Dict, Dict]):
+    """Bewaar een geanalyseerde rij; de langst niet gebruikte rijen vallen eruit."""
+    with analysis_cache_lock:
+        entry["rows"][key] = analyzed
+        entry["rows"].move_to_end(key)
+        while len(entry["rows"]) > ANALYSIS_CACHE_MAX_ROWS:
+            entry["rows"].popitem(last=False)
+
+def iter_analyzed_rows(entry: Dict, entities: Optional[List[str]], offset: int, limit: int) -> Iterator[Tuple[int, Dict, Dict]]:
+    """
+    Analyseer lazy de rijen [offset, offset + limit).
+    Yield per rij (index, analyzed_row, row_stats); al geanalyseerde rijen komen uit de cache.
+    """
+    df = entry["df"]
+    columns = list(df.columns)
+    entities_key = tuple(sorted(entities)) if entities else None
+    
+    for idx in range(offset, min(offset + limit, len(df))):
+        cached = get_cached_row(entry, (entities_key, idx))
+        if cached is None:
+            row = df.iloc[idx]
+            analyzed_row = {}
+            row_stats = defaultdict(lambda: defaultdict(int))
+            for col in columns:
+                cell = analyze_cell(row[col], entities)
+                analyzed_row[col] = cell
+                for entity in cell["entities"]:
+                    row_stats[col][entity["type"]] += 1
+            cached = (analyzed_row, {col: dict(counts) for col, counts in row_stats.items()})
+            put_cached_row(entry, (entities_key, idx), cached)
+        
+        yield idx, cached[0], cached[1]
+
+def suggest_pii_columns(columns: List[str], column_stats: Dict) -> List[str]:
+    """Bepaal suggesties op basis van content + kolomnaam."""
+    suggested_columns = []
+    for col in columns:
+        # Check of kolom PII bevat (via content of naam)
+        has_content_pii = any(stat > 0 for stat in column_stats.get(col, {}).values())
+        has_name_match = col in detect_pii_columns([col])
+        
+        if has_content_pii or has_name_match:
+            suggested_columns.append(col)
+    return suggested_columns
+
+async def resolve_deep_analyze_file(file: Optional[UploadFile], file_id: Optional[str], offset: int, limit: int) -> Tuple[str, Dict]:
+    """Valideer paginering en haal het bestand uit de cache of uit de upload."""
+    if offset < 0 or limit < 1 or limit > DEEP_ANALYZE_MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Ongeldige paginering: offset >= 0 en 1 <= limit <= {DEEP_ANALYZE_MAX_PAGE_SIZE}"
+        )
+    
+    if file_id:
+        entry = get_cached_file(file_id)
+        if entry is not None:
+            return file_id, entry
+    
+    if file is None:
+        raise HTTPException(status_code=404, detail="Bestand niet (meer) in cache, upload het opnieuw")
+    
+    contents = await file.read()
+    return await run_in_threadpool(cache_file, contents, file.filename)
+
+def build_deep_analyze_page(entry: Dict, file_id: str, entities: Optional[List[str]], offset: int, limit: int, compact: bool = False) -> Dict:
+    """Analyseer één pagina en bouw de deep-analyze response (volledig of compact)."""
+    df = entry["df"]
+    columns = list(df.columns)
+    
+    # Datastructuur voor response
+    analyzed_rows = []
+    column_stats = defaultdict(lambda: defaultdict(int))
+    
+    for idx, analyzed_row, row_stats in iter_analyzed_rows(entry, entities, offset, limit):
+        analyzed_rows.append(analyzed_row)
+        for col, counts in row_stats.items():
+            for entity_type, count in counts.items():
+                column_stats[col][entity_type] += count
+    
+    next_offset = offset + limit
+    
+    response = {
+        "file_id": file_id,
+        "total_rows": len(df),
+        "offset": offset,
+        "next_offset": next_offset if next_offset < len(df) else None,
+        "columns": columns,
+        "column_analysis": {col: dict(counts) for col, counts in column_stats.items()},
+        "suggested_pii_columns": suggest_pii_columns(columns, column_stats)
+    }
+    
+    if compact:
+        response["format"] = "compact"
+        response.update(build_compact_rows(columns, analyzed_rows))
+    else:
+        response["rows"] = analyzed_rows
+    return response
+
+# --- COMPACT RESPONSE FORMAT ---
+
+def build_compact_rows(columns: List[str], analyzed_rows: List[Dict]) -> Dict:
+    """
+    Zet geanalyseerde rijen om naar een kolomgeoriënteerd formaat.
+
+    Per kolom: `values` (originele waarden), `spans` (per cel een platte lijst
+    [start, end, type_index, ...]) en `scores` (per cel één score per span).
+    Entity types staan eenmalig in `entity_types`; `entity_labels` bevat het
+    bijbehorende anonimisatie label, zodat de client de preview zelf opbouwt.
+    """
+    entity_types = []
+    type_index = {}
+    data = {}
+    
+    for col in columns:
+        values = []
+        spans = []
+        scores = []
+        for analyzed_row in analyzed_rows:
+            cell = analyzed_row[col]
+            cell_spans = []
+            cell_scores = []
+            # Spans op volgorde van start, zodat de client van achter naar voren kan vervangen
+            for entity in sorted(cell["entities"], key=lambda e: e["start"]):
+                index = type_index.get(entity["type"])
+                if index is None:
+                    index = type_index[entity["type"]] = len(entity_types)
+                    entity_types.append(entity["type"])
+                cell_spans.extend((entity["start"], entity["end"], index))
+                cell_scores.append(round(entity["score"], 3))
+            values.append(cell["original"])
+            spans.append(cell_spans)
+            scores.append(cell_scores)
+        data[col] = {"values": values, "spans": spans, "scores": scores}
+    
+    return {
+        "row_count": len(analyzed_rows),
+        "entity_types": entity_types,
+        "entity_labels": [get_entity_label(entity_type) for entity_type in entity_types],
+        "data": data,
+    }
+
+def compact_response(payload: Dict) -> Response:
+    """Encodeer met orjson; compressie doet de GZipMiddleware."""
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return Response(content=body, media_type="application/json")
+
 # --- ENDPOINTS ---
 
 @app.post("/api/preview")
@@ -319,104 +828,115 @@ async def preview_file(file: UploadFile = File(...)):
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Fout bij lezen bestand: {str(e)}")
 
+@app.get("/api/cascade-stats")
+async def cascade_statistics():
+    """Escalatiegraad en speed-up van de model cascade sinds de laatste reset."""
+    return get_cascade_report()
+
+@app.post("/api/cascade-stats/reset")
+async def reset_cascade_statistics():
+    """Zet de cascade statistieken terug naar nul (bv. vóór een meting)."""
+    reset_cascade_stats()
+    return get_cascade_report()
+
 @app.post("/api/deep-analyze")
 async def deep_analyze_file(
-    file: UploadFile = File(...),
-    options: str = Form(...)
+    file: Optional[UploadFile] = File(None),
+    options: str = Form(...),
+    file_id: Optional[str] = Form(None),
+    offset: int = Form(0),
+    limit: int = Form(DEEP_ANALYZE_PAGE_SIZE),
+    response_format: str = Form("full", alias="format")
 ):
     """
-    Diepgaande analyse van ALLE kolommen.
+    Diepgaande analyse van ALLE kolommen, per pagina van `limit` rijen vanaf `offset`.
     Retourneert per cel de originele waarde EN gedetecteerde entities.
+    Met het teruggegeven file_id kunnen volgende pagina's zonder upload opgevraagd worden.
+    Met format="compact" komt de response kolomgeoriënteerd terug (orjson).
     """
     try:
         # Parse options
         opts = json.loads(options)
         entities_to_find = get_entities_to_analyze(opts)
         
-        contents = await file.read()
-        buffer = io.BytesIO(contents)
+        if response_format not in ("full", "compact"):
+            raise HTTPException(status_code=400, detail=f"Onbekend format: {response_format}")
         
-        # Lees bestand
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(buffer)
-        else:
-            df = pd.read_excel(buffer)
+        file_id, entry = await resolve_deep_analyze_file(file, file_id, offset, limit)
         
-        df = df.fillna("")
-        
-        # Analyseer eerste 10 rijen
-        preview_df = df.head(10)
-        columns = list(df.columns)
-        
-        # Datastructuur voor response
-        analyzed_rows = []
-        column_stats = defaultdict(lambda: defaultdict(int))
-        
-        for idx, row in preview_df.iterrows():
-            analyzed_row = {}
-            
-            for col in columns:
-                cell_value = row[col]
-                text_value = str(cell_value) if pd.notna(cell_value) and cell_value != "" else ""
-                
-                # Analyseer deze cel
-                entities_found = []
-                if text_value:
-                    results = analyze_text(text_value, entities_to_find, "nl")
-                    
-                    for result in results:
-                        entities_found.append({
-                            "type": result.entity_type,
-                            "start": result.start,
-                            "end": result.end,
-                            "score": result.score,
-                            "text": text_value[result.start:result.end]
-                        })
-                        
-                        # Update stats
-                        column_stats[col][result.entity_type] += 1
-                
-                # Genereer preview (geanonimiseerde versie)
-                preview_text = text_value
-                if entities_found:
-                    # Sorteer entities van achter naar voren om indices te behouden
-                    sorted_entities = sorted(entities_found, key=lambda x: x['start'], reverse=True)
-                    for entity in sorted_entities:
-                        label = get_entity_label(entity['type'])
-                        preview_text = preview_text[:entity['start']] + label + preview_text[entity['end']:]
-                
-                analyzed_row[col] = {
-                    "original": text_value,
-                    "entities": entities_found,
-                    "preview": preview_text,
-                    "has_pii": len(entities_found) > 0
-                }
-            
-            analyzed_rows.append(analyzed_row)
-        
-        # Bepaal suggesties op basis van content + kolomnaam
-        suggested_columns = []
-        for col in columns:
-            # Check of kolom PII bevat (via content of naam)
-            has_content_pii = any(stat > 0 for stat in column_stats[col].values())
-            has_name_match = col in detect_pii_columns([col])
-            
-            if has_content_pii or has_name_match:
-                suggested_columns.append(col)
+        # Analyse in de threadpool, zodat de event loop andere requests blijft bedienen
+        response = await run_in_threadpool(
+            build_deep_analyze_page, entry, file_id, entities_to_find, offset, limit, response_format == "compact"
+        )
         
-        return {
-            "columns": columns,
-            "rows": analyzed_rows,
-            "column_analysis": dict(column_stats),
-            "suggested_pii_columns": suggested_columns
-        }
+        if response_format == "compact":
+            return compact_response(response)
+        return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Deep analyze error: {e}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Fout bij deep analyze: {str(e)}")
 
+@app.post("/api/deep-analyze/stream")
+async def deep_analyze_stream(
+    file: Optional[UploadFile] = File(None),
+    options: str = Form(...),
+    file_id: Optional[str] = Form(None),
+    offset: int = Form(0),
+    limit: int = Form(DEEP_ANALYZE_MAX_PAGE_SIZE)
+):
+    """
+    Streaming variant van deep-analyze (NDJSON).
+    Eerst een "meta" regel, dan één "row" regel per geanalyseerde rij, afgesloten met een "summary" regel.
+    """
+    try:
+        opts = json.loads(options)
+        entities_to_find = get_entities_to_analyze(opts)
+        
+        file_id, entry = await resolve_deep_analyze_file(file, file_id, offset, limit)
+        df = entry["df"]
+        columns = list(df.columns)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Deep analyze stream error: {e}")
+        raise HTTPException(status_code=500, detail=f"Fout bij deep analyze: {str(e)}")
+    
+    def generate():
+        yield json.dumps({
+            "type": "meta",
+            "file_id": file_id,
+            "total_rows": len(df),
+            "offset": offset,
+            "columns": columns
+        }) + "\n"
+        
+        column_stats = defaultdict(lambda: defaultdict(int))
+        try:
+            for idx, analyzed_row, row_stats in iter_analyzed_rows(entry, entities_to_find, offset, limit):
+                for col, counts in row_stats.items():
+                    for entity_type, count in counts.items():
+                        column_stats[col][entity_type] += count
+                yield json.dumps({"type": "row", "index": idx, "row": analyzed_row}) + "\n"
+        except Exception as e:
+            print(f"Deep analyze stream error: {e}")
+            yield json.dumps({"type": "error", "detail": f"Fout bij deep analyze: {str(e)}"}) + "\n"
+            return
+        
+        next_offset = offset + limit
+        yield json.dumps({
+            "type": "summary",
+            "next_offset": next_offset if next_offset < len(df) else None,
+            "column_analysis": {col: dict(counts) for col, counts in column_stats.items()},
+            "suggested_pii_columns": suggest_pii_columns(columns, column_stats)
+        }) + "\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @app.post("/api/anonymize")
 async def anonymize_file(
     file: UploadFile = File(...),
@@ -479,7 +999,7 @@ async def anonymize_file(
         
         return StreamingResponse(
             output,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            media_type=XLSX_MEDIA_TYPE,
             headers={"Content-Disposition": f"attachment; filename=anon_{file.filename}"}
         )
     
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script voor de windowing van lange tekst.
+Run dit script om te valideren dat vensters de hele tekst dekken, offsets
+van analyze_windowed correct worden teruggerekend en dubbelingen uit de
+overlap samengevoegd worden. De NLP stap wordt hierbij vervangen door een
+stub, zodat alleen de offset logica getest wordt.
+"""
+
+import re
+import sys
+
+from presidio_analyzer import RecognizerResult
+
+import main as app_main
+from main import split_windows, merge_window_results, WINDOW_SIZE
+
+NAME = "Jan Jansen"
+
+failures = 0
+
+def check(condition: bool, description: str):
+    """Print het resultaat van één controle."""
+    global failures
+    if condition:
+        print(f"  ✅ {description}")
+    else:
+        failures += 1
+        print(f"  ❌ {description}")
+
+def build_long_text() -> str:
+    """
+    Lange vrije tekst met namen verspreid over meerdere vensters.
+    NAME staat in drie van de vier zinnen, zodat elke overlap een volledige NAME bevat.
+    """
+    sentences = [
+        "De heer Jan Jansen heeft contact opgenomen met makelaar Spithoff.",
+        "Maria de Vries woont in Rotterdam en heeft een verzekering via Vanbreda.",
+        "Graag Jan Jansen terugbellen op 06-12345678 voor de poliswijziging!",
+        "Heeft Jan Jansen de premie al betaald via IBAN NL91ABNA0417164300?",
+    ]
+    return "\n".join(" ".join(sentences) for _ in range(WINDOW_SIZE // 50))
+
+def test_coverage(text: str, windows):
+    print("\nVensters dekken de hele tekst")
+    check(windows[0][0] == 0, "Eerste venster begint op offset 0")
+    check(windows[-1][0] + len(windows[-1][1]) == len(text), "Laatste venster eindigt aan het einde van de tekst")
+    check(all(len(window) <= WINDOW_SIZE for _, window in windows), f"Geen venster langer dan {WINDOW_SIZE}")
+    check(
+        all(offset < next_offset < offset + len(window)
+            for (offset, window), (next_offset, _) in zip(windows, windows[1:])),
+        "Opeenvolgende vensters overlappen en gaan vooruit"
+    )
+
+class StubNlpEngine:
+    """Geeft per venster lege NLP artifacts terug."""
+    def process_batch(self, texts, language, batch_size=1):
+        for text in texts:
+            yield text, None
+
+class StubAnalyzer:
+    """Vindt NAME in elk venster, met offsets relatief aan het venster."""
+    def analyze(self, text, entities=None, language="nl", nlp_artifacts=None, return_decision_process=False):
+        return [
+            RecognizerResult("PERSON", match.start(), match.end(), 0.85)
+            for match in re.finditer(re.escape(NAME), text)
+        ]
+
+def test_offsets(text: str):
+    print("\nTeruggerekende offsets van analyze_windowed wijzen naar dezelfde tekst")
+    original_engine, original_analyzer = app_main.nlp_engine, app_main.analyzer
+    app_main.nlp_engine, app_main.analyzer = StubNlpEngine(), StubAnalyzer()
+    try:
+        results = app_main.analyze_windowed(text)
+    finally:
+        app_main.nlp_engine, app_main.analyzer = original_engine, original_analyzer
+
+    expected = [(m.start(), m.end()) for m in re.finditer(re.escape(NAME), text)]
+    found = [(r.start, r.end) for r in results]
+    check(len(expected) > 0, f"'{NAME}' komt voor in de testtekst")
+    check(all(text[start:end] == NAME for start, end in found), "Elke teruggerekende span slicet de naam uit het origineel")
+    check(found == expected, f"Precies één span per voorkomen ({len(found)} gevonden, {len(expected)} verwacht)")
+
+def find_name_in_overlap(text: str, windows):
+    """Zoek een voorkomen van NAME dat volledig in de overlap van twee vensters ligt."""
+    for (offset, window), (next_offset, _) in zip(windows, windows[1:]):
+        start = text.find(NAME, next_offset, offset + len(window))
+        if start != -1:
+            return start
+    return -1
+
+def test_merge(text: str, windows):
+    print("\nDubbelingen uit de overlap worden samengevoegd")
+    start = find_name_in_overlap(text, windows)
+    check(start != -1, f"'{NAME}' ligt in de overlap van twee vensters")
+    if start == -1:
+        return
+    end = start + len(NAME)
+
+    # Dezelfde naam gevonden in beide vensters, plus een afgekapte span aan de vensterrand
+    results = [
+        RecognizerResult("PERSON", start, start + 3, 0.85),
+        RecognizerResult("PERSON", start, end, 0.85),
+        RecognizerResult("PERSON", start, end, 0.85),
+        RecognizerResult("EMAIL_ADDRESS", 0, 5, 0.9),
+    ]
+    merged = merge_window_results(results)
+    persons = [r for r in merged if r.entity_type == "PERSON"]
+    check(len(persons) == 1, "Eén PERSON span over na samenvoegen")
+    check(bool(persons) and (persons[0].start, persons[0].end) == (start, end), "Samengevoegde span dekt de volledige naam")
+    check(any(r.entity_type == "EMAIL_ADDRESS" for r in merged), "Spans van een ander type blijven staan")
+
+def main():
+    print("\n" + "="*80)
+    print("WINDOWING TEST SUITE")
+    print("="*80)
+
+    text = build_long_text()
+    windows = split_windows(text)
+    print(f"Tekst van {len(text)} tekens, {len(windows)} vensters")
+
+    test_coverage(text, windows)
+    test_offsets(text)
+    test_merge(text, windows)
+
+    # Geen zinsgrens en maar één spatie: de overlap mag niet naar nul gaan
+    text = "x" * (WINDOW_SIZE * 2 + 1) + " " + "y" * WINDOW_SIZE
+    test_coverage(text, split_windows(text))
+
+    print("\n" + "="*80)
+    print("TEST SUITE VOLTOOID" if not failures else f"{failures} CONTROLE(S) MISLUKT")
+    print("="*80 + "\n")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import React, { useState } from 'react';
 import { Switch } from '@/components/ui/switch';
 import { Badge } from '@/components/ui/badge';
-import { ShieldAlert, ShieldCheck, Eye, EyeOff } from 'lucide-react';
+import { ShieldAlert, ShieldCheck, Eye, EyeOff, Loader2, ChevronDown } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import {
   Tooltip,
@@ -34,6 +34,10 @@ export interface CellData {
 interface PreviewDataTableProps {
   columns: ColumnConfig[];
   rows: Array<Record<string, CellData>>;
+  totalRows?: number;
+  hasMore?: boolean;
+  onLoadMore?: () => void;
+  isLoadingMore?: boolean;
   onColumnToggle: (columnName: string) => void;
   showAnonymized?: boolean;
 }
@@ -41,6 +45,10 @@ interface PreviewDataTableProps {
 export const PreviewDataTable: React.FC<PreviewDataTableProps> = ({
   columns,
   rows,
+  totalRows,
+  hasMore = false,
+  onLoadMore,
+  isLoadingMore = false,
   onColumnToggle,
   showAnonymized = false,
 }) => {
@@ -176,7 +184,8 @@ export const PreviewDataTable: React.FC<PreviewDataTableProps> = ({
     <div className="space-y-4">
       <div className="flex items-center justify-between">
         <div className="text-sm text-muted-foreground">
-          Eerste 10 rijen • Scroll horizontaal voor alle kolommen
+          {totalRows !== undefined ? `${rows.length} van ${totalRows} rijen` : `Eerste ${rows.length} rijen`}
+          {' '}• Scroll horizontaal voor alle kolommen
         </div>
         <Button
           variant="outline"
@@ -273,6 +282,30 @@ export const PreviewDataTable: React.FC<PreviewDataTableProps> = ({
         </table>
       </div>
 
+      {hasMore && onLoadMore && (
+        <div className="flex justify-center">
+          <Button
+            variant="outline"
+            size="sm"
+            onClick={onLoadMore}
+            disabled={isLoadingMore}
+            className="gap-2"
+          >
+            {isLoadingMore ? (
+              <>
+                <Loader2 className="w-4 h-4 animate-spin" />
+                Rijen analyseren...
+              </>
+            ) : (
+              <>
+                <ChevronDown className="w-4 h-4" />
+                Meer rijen laden
+              </>
+            )}
+          </Button>
+        </div>
+      )}
+
       <div className="flex gap-4 text-xs text-muted-foreground flex-wrap">
         <div className="flex items-center gap-2">
           <span className="px-2 py-1 rounded bg-yellow-100 text-yellow-900 border border-yellow-300">
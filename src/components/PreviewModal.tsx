@@ -19,6 +19,10 @@ interface PreviewModalProps {
   onAnonymize: () => void;
   columns: ColumnConfig[];
   rows: Array<Record<string, CellData>>;
+  totalRows?: number;
+  hasMore?: boolean;
+  onLoadMore?: () => void;
+  isLoadingMore?: boolean;
   onColumnToggle: (columnName: string) => void;
   isProcessing?: boolean;
   fileName?: string;
@@ -30,6 +34,10 @@ export const PreviewModal: React.FC<PreviewModalProps> = ({
   onAnonymize,
   columns,
   rows,
+  totalRows,
+  hasMore = false,
+  onLoadMore,
+  isLoadingMore = false,
   onColumnToggle,
   isProcessing = false,
   fileName = 'bestand',
@@ -64,7 +72,8 @@ export const PreviewModal: React.FC<PreviewModalProps> = ({
             PII Analyse: {fileName}
           </DialogTitle>
           <DialogDescription className="text-muted-foreground text-base mt-2">
-            Hieronder zie je de eerste 10 rijen van je bestand met alle gedetecteerde PII gemarkeerd.
+            Hieronder zie je de eerste {rows.length}
+            {totalRows !== undefined && ` van ${totalRows}`} rijen van je bestand met alle gedetecteerde PII gemarkeerd.
             Selecteer welke kolommen je wilt anonimiseren.
           </DialogDescription>
         </DialogHeader>
@@ -127,6 +136,10 @@ export const PreviewModal: React.FC<PreviewModalProps> = ({
           <PreviewDataTable
             columns={columns}
             rows={rows}
+            totalRows={totalRows}
+            hasMore={hasMore}
+            onLoadMore={onLoadMore}
+            isLoadingMore={isLoadingMore}
             onColumnToggle={onColumnToggle}
           />
         </div>
@@ -8,12 +8,88 @@ export interface PreviewData {
 }
 
 export interface DeepAnalyzeData {
+  file_id?: string;
+  total_rows?: number;
+  offset?: number;
+  next_offset?: number | null;
   columns: string[];
   rows: Array<Record<string, CellData>>;
   column_analysis: Record<string, Record<string, number>>;
   suggested_pii_columns: string[];
 }
 
+export interface CompactDeepAnalyzeData {
+  format: "compact";
+  file_id: string;
+  total_rows: number;
+  offset: number;
+  next_offset: number | null;
+  columns: string[];
+  row_count: number;
+  entity_types: string[];
+  entity_labels: string[];
+  data: Record<
+    string,
+    { values: string[]; spans: number[][]; scores: number[][] }
+  >;
+  column_analysis: Record<string, Record<string, number>>;
+  suggested_pii_columns: string[];
+}
+
+// Bouw het volledige per-cel formaat op uit de compacte (kolomgeoriënteerde) response
+export const expandCompactDeepAnalyze = (
+  compact: CompactDeepAnalyzeData
+): DeepAnalyzeData => {
+  const rows: Array<Record<string, CellData>> = [];
+  for (let i = 0; i < compact.row_count; i++) {
+    const row: Record<string, CellData> = {};
+    for (const column of compact.columns) {
+      const { values, spans, scores } = compact.data[column];
+      const original = values[i];
+      const entities: CellData["entities"] = [];
+      for (let j = 0; j < spans[i].length; j += 3) {
+        const [start, end, typeIndex] = spans[i].slice(j, j + 3);
+        entities.push({
+          type: compact.entity_types[typeIndex],
+          start,
+          end,
+          score: scores[i][j / 3],
+          text: original.slice(start, end),
+        });
+      }
+
+      // Vervang van achter naar voren om indices te behouden
+      let preview = original;
+      for (let j = spans[i].length - 3; j >= 0; j -= 3) {
+        const [start, end, typeIndex] = spans[i].slice(j, j + 3);
+        preview =
+          preview.slice(0, start) +
+          compact.entity_labels[typeIndex] +
+          preview.slice(end);
+      }
+
+      row[column] = {
+        original,
+        entities,
+        preview,
+        has_pii: entities.length > 0,
+      };
+    }
+    rows.push(row);
+  }
+
+  return {
+    file_id: compact.file_id,
+    total_rows: compact.total_rows,
+    offset: compact.offset,
+    next_offset: compact.next_offset,
+    columns: compact.columns,
+    rows,
+    column_analysis: compact.column_analysis,
+    suggested_pii_columns: compact.suggested_pii_columns,
+  };
+};
+
 const API_URL = "http://localhost:8000/api";
 
 export const mockPreviewFile = async (file: File): Promise<PreviewData> => {
@@ -40,11 +116,23 @@ export const mockPreviewFile = async (file: File): Promise<PreviewData> => {
 
 export const deepAnalyzeFile = async (
   file: File,
-  options: AnonymizeOptions
+  options: AnonymizeOptions,
+  offset = 0,
+  limit = 10,
+  fileId?: string,
+  format: "full" | "compact" = "full"
 ): Promise<DeepAnalyzeData> => {
   const formData = new FormData();
-  formData.append("file", file);
+  // Met een file_id hoeft het bestand niet opnieuw geüpload te worden
+  if (fileId) {
+    formData.append("file_id", fileId);
+  } else {
+    formData.append("file", file);
+  }
   formData.append("options", JSON.stringify(options));
+  formData.append("offset", String(offset));
+  formData.append("limit", String(limit));
+  formData.append("format", format);
 
   try {
     const response = await fetch(`${API_URL}/deep-analyze`, {
@@ -52,12 +140,20 @@ export const deepAnalyzeFile = async (
       body: formData,
     });
 
+    // Bestand is uit de server cache verdwenen: opnieuw uploaden
+    if (fileId && response.status === 404) {
+      return deepAnalyzeFile(file, options, offset, limit, undefined, format);
+    }
+
     if (!response.ok) {
       throw new Error("Fout bij deep analyze");
     }
 
     const data = await response.json();
-    return data;
+    // Compact formaat terug omzetten naar het per-cel formaat van de tabel
+    return format === "compact"
+      ? expandCompactDeepAnalyze(data as CompactDeepAnalyzeData)
+      : data;
   } catch (error) {
     console.error("Deep analyze error:", error);
     throw error;
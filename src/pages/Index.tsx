@@ -8,12 +8,16 @@ import { deepAnalyzeFile, mockAnonymizeFile, DeepAnalyzeData } from '@/lib/mockD
 import { useToast } from '@/hooks/use-toast';
 import { ShieldCheck, Loader2, Upload, Eye, Lock, Zap, FileSpreadsheet, ArrowRight } from 'lucide-react';
 
+// Aantal rijen per deep-analyze pagina
+const PAGE_SIZE = 10;
+
 const Index = () => {
   const { toast } = useToast();
   const [file, setFile] = useState<File | null>(null);
   const [filters, setFilters] = useState<PIIFilter[]>(DEFAULT_PII_FILTERS);
   const [isAnalyzing, setIsAnalyzing] = useState(false);
   const [isProcessing, setIsProcessing] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [previewOpen, setPreviewOpen] = useState(false);
   const [analyzeData, setAnalyzeData] = useState<DeepAnalyzeData | null>(null);
   const [columns, setColumns] = useState<ColumnConfig[]>([]);
@@ -38,7 +42,7 @@ const Index = () => {
       );
 
       // Use deep analyze endpoint
-      const response = await deepAnalyzeFile(file, options);
+      const response = await deepAnalyzeFile(file, options, 0, PAGE_SIZE);
       setAnalyzeData(response);
       
       // Initialize column configs with stats from deep analyze
@@ -73,6 +77,64 @@ const Index = () => {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!file || !analyzeData || analyzeData.next_offset == null) return;
+
+    setIsLoadingMore(true);
+    try {
+      const options = filters.reduce<AnonymizeOptions>(
+        (acc, f) => ({ ...acc, [f.id]: f.enabled }),
+        {}
+      );
+
+      // Volgende pagina via file_id, zonder het bestand opnieuw te uploaden
+      const page = await deepAnalyzeFile(
+        file,
+        options,
+        analyzeData.next_offset,
+        PAGE_SIZE,
+        analyzeData.file_id
+      );
+
+      // Statistieken van de nieuwe pagina optellen bij wat we al hadden
+      const columnAnalysis = { ...analyzeData.column_analysis };
+      Object.entries(page.column_analysis).forEach(([col, stats]) => {
+        const merged = { ...(columnAnalysis[col] || {}) };
+        Object.entries(stats).forEach(([type, count]) => {
+          merged[type] = (merged[type] || 0) + count;
+        });
+        columnAnalysis[col] = merged;
+      });
+
+      setAnalyzeData({
+        ...page,
+        rows: [...analyzeData.rows, ...page.rows],
+        column_analysis: columnAnalysis,
+        suggested_pii_columns: Array.from(
+          new Set([...analyzeData.suggested_pii_columns, ...page.suggested_pii_columns])
+        ),
+      });
+
+      // Bestaande kolomkeuzes van de gebruiker behouden, alleen stats en suggesties bijwerken
+      setColumns(cols =>
+        cols.map(c => ({
+          ...c,
+          suggestedPII: c.suggestedPII || page.suggested_pii_columns.includes(c.name),
+          stats: columnAnalysis[c.name] || {},
+        }))
+      );
+    } catch (error) {
+      console.error('Load more error:', error);
+      toast({
+        variant: 'destructive',
+        title: 'Fout bij laden',
+        description: 'Er is een fout opgetreden bij het laden van meer rijen.',
+      });
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleColumnToggle = (columnName: string) => {
     setColumns(cols =>
       cols.map(c =>
@@ -238,6 +300,10 @@ const Index = () => {
           onAnonymize={handleAnonymize}
           columns={columns}
           rows={analyzeData.rows}
+          totalRows={analyzeData.total_rows}
+          hasMore={analyzeData.next_offset != null}
+          onLoadMore={handleLoadMore}
+          isLoadingMore={isLoadingMore}
           onColumnToggle={handleColumnToggle}
           isProcessing={isProcessing}
           fileName={file?.name}